@@ -0,0 +1,25 @@
+# Submodules are imported on first attribute access, so "import aiskit" stays cheap and
+# optional parts (columnar output, follow mode, ...) are only loaded by callers that use them.
+import importlib
+
+__version__ = "1.0"
+
+_EXPORTS = {
+  "decode_armored_ascii": "sixbit",
+  "parse_ais": "parsers",
+  "split_tag_block": "nmea",
+  "tag_timestamp": "nmea",
+  "reassemble": "nmea",
+  "AnomalyDetector": "anomaly",
+  "StaticReportCache": "static",
+  "ColumnarDecoder": "columnar",
+  "follow": "follow",
+}
+
+def __getattr__(name):
+  if name not in _EXPORTS:
+    raise AttributeError(f"module 'aiskit' has no attribute {name!r}")
+  return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+
+def __dir__():
+  return sorted(list(globals()) + list(_EXPORTS))
@@ -0,0 +1,114 @@
+import math
+from collections import OrderedDict
+
+def mmsi_is_valid(mmsi):
+  # Check the MMSI has a valid Maritime Identification Digits (MID) prefix for its station kind
+  if not 0 < mmsi < 1000000000:
+    return False
+  digits = f"{mmsi:09d}"
+  if digits[:3] in ("970", "972", "974"):  # AIS-SART, MOB and EPIRB-AIS devices carry no MID
+    return True
+  elif digits[0] in "234567":  # Ship station
+    mid = digits[0:3]
+  elif digits[:3] == "111":  # SAR aircraft
+    mid = digits[3:6]
+  elif digits[:2] in ("00", "98", "99"):  # Coast station, auxiliary craft, aid to navigation
+    mid = digits[2:5]
+  elif digits[0] in "08":  # Group call, handheld VHF
+    mid = digits[1:4]
+  else:
+    return False
+  return 201 <= int(mid) <= 775
+
+def imo_is_valid(imo):
+  # IMO numbers are 7 digits with the last being a weighted checksum of the first 6
+  if not 1000000 <= imo <= 9999999:
+    return False
+  digits = str(imo)
+  check = sum(int(d) * w for d, w in zip(digits[:6], range(7, 1, -1))) % 10
+  return check == int(digits[6])
+
+def distance_nm(lat_1, lon_1, lat_2, lon_2):
+  # Great circle distance between two points in nautical miles (haversine)
+  lat_1, lon_1, lat_2, lon_2 = map(math.radians, (lat_1, lon_1, lat_2, lon_2))
+  a = math.sin((lat_2 - lat_1) / 2) ** 2 + math.cos(lat_1) * math.cos(lat_2) * math.sin((lon_2 - lon_1) / 2) ** 2
+  return 2 * 3440.065 * math.asin(min(1.0, math.sqrt(a)))
+
+class AnomalyDetector:
+  # Streaming spoofing/anomaly checks over decoded messages. State is kept per MMSI and bounded
+  # to max_vessels entries, evicting the least recently seen vessel first.
+  POSITION_TYPES = (1, 2, 3, 18, 19)
+  IDENTITY_FIELDS = ("IMO Number", "Call Sign", "Vessel Name", "Ship Type")
+
+  def __init__(self, max_vessels=100000, max_speed=50.0, min_distance=1.0, min_interval=10.0):
+    self.vessels = OrderedDict()
+    self.max_vessels = max_vessels
+    self.max_speed = max_speed          # Fastest plausible speed over ground (knots)
+    self.min_distance = min_distance    # Ignore position changes smaller than this (nautical miles)
+    self.min_interval = min_interval    # Floor on time between reports (seconds), absorbs receive jitter
+
+  def vessel(self, mmsi):
+    state = self.vessels.get(mmsi)
+    if state is None:
+      state = self.vessels[mmsi] = {"pos": None, "alt": None, "identity": {}}
+      if len(self.vessels) > self.max_vessels:
+        self.vessels.popitem(last=False)
+    else:
+      self.vessels.move_to_end(mmsi)
+    return state
+
+  def implied_speed(self, fix_1, fix_2):
+    dist = distance_nm(fix_1[0], fix_1[1], fix_2[0], fix_2[1])
+    dt = max(fix_2[2] - fix_1[2], self.min_interval)
+    return dist, dist * 3600.0 / dt
+
+  def check(self, msg_dict, timestamp):
+    # Returns a list of anomaly dicts raised by this message (usually empty). With a timestamp of
+    # None the position jump and collision checks are skipped for this fix.
+    mmsi = msg_dict.get("MMSI")
+    if mmsi is None:
+      return []
+    anomalies = []
+    new_vessel = mmsi not in self.vessels
+    state = self.vessel(mmsi)
+
+    def flag(kind, detail):
+      anomalies.append({"Anomaly": kind, "MMSI": mmsi, "Message Type": msg_dict["Message Type"], "Detail": detail})
+
+    if new_vessel and not mmsi_is_valid(mmsi):
+      flag("Invalid MMSI", f"{mmsi:09d} has no valid MID prefix")
+
+    if msg_dict["Message Type"] in self.POSITION_TYPES:
+      lat, lon = msg_dict["Latitude"], msg_dict["Longitude"]
+      if abs(lat) <= 90 and abs(lon) <= 180:  # 91/181 mean "not available"
+        fix = (lat, lon, timestamp)
+        last = state["pos"]
+        if last is not None and last[2] is not None and timestamp is not None:
+          dist, speed = self.implied_speed(last, fix)
+          if dist > self.min_distance and speed > self.max_speed:
+            alt = state["alt"]
+            # A jump back to a previously seen track means two transmitters share this MMSI
+            if alt is not None and alt[2] is not None and self.implied_speed(alt, fix)[1] <= self.max_speed:
+              flag("MMSI Collision", f"Reported {dist:.1f} nm from last position, consistent with a second track")
+            else:
+              flag("Position Jump", f"Moved {dist:.1f} nm, implied speed {speed:.0f} knots")
+            state["alt"] = last
+        state["pos"] = fix
+
+    identity = state["identity"]
+    for field in self.IDENTITY_FIELDS:
+      value = msg_dict.get(field)
+      if field == "Vessel Name" and value is None:
+        value = msg_dict.get("Name")
+      if value in (None, "", 0, "Not Available"):
+        continue
+      old = identity.get(field)
+      if old == value:
+        continue
+      if field == "IMO Number" and not imo_is_valid(value):
+        flag("Invalid IMO", f"{value} fails IMO check digit")
+      if old is not None:
+        flag("Identity Change", f"{field}: {old!r} -> {value!r}")
+      identity[field] = value
+
+    return anomalies
@@ -0,0 +1,131 @@
+import signal, argparse, time
+
+from .sixbit import decode_armored_ascii, ascii_to_sixbit
+from .parsers import parse_ais
+from .nmea import reassemble, tag_timestamp, fill_bits
+
+def print_data(id_only, msg_dict):
+  id_fields = ["MMSI", "Call Sign", "Vessel Name", "Name"]
+  for key, value in msg_dict.items():
+    if(id_only and key in id_fields):
+      print(f"{key}: {value}")
+    elif(not id_only):
+      print(f"{key}: {value}")
+  print()
+
+def sig_handler(sig, frame):
+  exit()
+
+def handle_args():
+  parser = argparse.ArgumentParser(prog="aisdump.py", description="Dump data from NMEA AIS messages.", epilog="Author: Dylan Smyth (https://github.com/smythtech)")
+  parser.add_argument("-r", "--read", help="Input filename.", required=True)
+  parser.add_argument("-t", "--type", help="Filter by message type.", required=False)
+  parser.add_argument("-i", "--id-only", help="Dump ID data only (MMSIs, Names, Call Signs).", required=False, action='store_true')
+  parser.add_argument("-a", "--anomalies", help="Report spoofing/anomalies (position jumps, MMSI collisions, identity changes, invalid MMSI/IMO) instead of messages.", required=False, action='store_true')
+  parser.add_argument("--max-speed", help="Fastest plausible vessel speed in knots for anomaly checks (default: 50).", required=False, type=float, default=50.0)
+  parser.add_argument("-m", "--merge-static", help="Combine type 24 Part A and Part B reports into one record per vessel.", required=False, action='store_true')
+  parser.add_argument("--merge-max-age", help="Seconds to hold one half of a type 24 report waiting for the other, needs tag block timestamps or --follow (default: 600).", required=False, type=float, default=600.0)
+  parser.add_argument("-c", "--columnar", help="Decode into typed columns in batches and write one Arrow IPC file per message type to this directory (requires pyarrow).", required=False)
+  parser.add_argument("--batch-size", help="Messages per type decoded together in --columnar mode (default: 65536).", required=False, type=int, default=65536)
+  parser.add_argument("-f", "--follow", help="Keep reading new lines as they are appended to the input file (handles rotation and truncation).", required=False, action='store_true')
+  parser.add_argument("--checkpoint", help="Checkpoint file used with --follow to save and resume the read position.", required=False)
+  parser.add_argument("--checkpoint-interval", help="Seconds between checkpoint writes, one is always written on exit (default: 10).", required=False, type=float, default=10.0)
+  parser.add_argument("--poll-interval", help="Longest wait in seconds before re-checking the input file with --follow (default: 1).", required=False, type=float, default=1.0)
+  parser.add_argument('--version', action='version', version='%(prog)s 1.0')
+
+  args = parser.parse_args()
+  if(args.checkpoint and not args.follow):
+    parser.error("--checkpoint requires --follow")
+  if(args.columnar):
+    if(args.anomalies or args.merge_static or args.id_only or args.follow):
+      parser.error("--columnar cannot be combined with --anomalies, --merge-static, --id-only or --follow")
+    from importlib.util import find_spec
+    if(find_spec("pyarrow") == None):
+      parser.error("--columnar requires pyarrow (pip install pyarrow)")
+  return args
+
+def process_columnar(args, decoder, frag_buffer, msg):
+  try:
+    message = reassemble(frag_buffer, msg)
+    if(message == None):
+      return
+    tags, nmea_msg, ais_payload = message
+    if((args.type == None) or (int(args.type) == ascii_to_sixbit(ais_payload[0]))):
+      decoder.add(ais_payload, fill_bits(nmea_msg))
+  except Exception as e:
+    print(f"Encountered error parsing message {msg.strip()}: {e}")
+
+def process_line(args, detector, static_cache, frag_buffer, msg):
+  try:
+    # Malformed sentences are reported and skipped like undecodable payloads, so one bad line
+    # cannot stop a run (or, in follow mode, be replayed from the checkpoint on every restart)
+    message = reassemble(frag_buffer, msg)
+    if(message == None):
+      return
+    tags, nmea_msg, ais_payload = message
+    bitstream = decode_armored_ascii(ais_payload)
+    # Without a tag block receive time only a live feed (--follow) can use the time the line was
+    # read. Lines read from a capture arrive together, so their timestamp is left as None.
+    timestamp = tag_timestamp(tags)
+    if(timestamp == None and args.follow):
+      timestamp = time.time()
+    if((detector == None) and (args.type != None) and (int(args.type) != int(bitstream[0:6], 2))):
+      return
+    msg_dict = parse_ais(bitstream)
+    if(static_cache != None and msg_dict["Message Type"] == 24):
+      # Type 24 halves are held back and passed on (printed or checked) as one merged record
+      msg_dict = static_cache.add(msg_dict, timestamp)
+      if(msg_dict == None):
+        return
+    if(detector != None):
+      # Every message updates the detector's state, -t only limits which anomalies are reported
+      for anomaly in detector.check(msg_dict, timestamp):
+        if((args.type == None) or (int(args.type) == anomaly["Message Type"])):
+          print_data(False, anomaly)  # Anomalies are always shown in full, -i only trims messages
+    else:
+      print_data(args.id_only, msg_dict)
+  except TypeError as e:
+    print(f"Error: {e}")
+    exit()
+  except Exception as e:
+    print(f"Encountered error parsing message {msg.strip()}: {e}")
+
+def run(args):
+  # Optional stages are imported only when their flag is given, keeping short runs cheap to start
+  sink = None
+  if(args.columnar):
+    from .columnar import ColumnarDecoder, ArrowFileSink
+    sink = ArrowFileSink(args.columnar)
+    decoder = ColumnarDecoder(batch_size=args.batch_size, sink=sink)
+    handle_line = lambda msg, frag_buffer: process_columnar(args, decoder, frag_buffer, msg)
+  else:
+    detector = None
+    static_cache = None
+    if(args.anomalies):
+      from .anomaly import AnomalyDetector
+      detector = AnomalyDetector(max_speed=args.max_speed)
+    if(args.merge_static):
+      from .static import StaticReportCache
+      static_cache = StaticReportCache(max_age=args.merge_max_age)
+    handle_line = lambda msg, frag_buffer: process_line(args, detector, static_cache, frag_buffer, msg)
+
+  try:
+    if(args.follow):
+      from .follow import follow
+      follow(args, handle_line)
+      return
+
+    frag_buffer = {}
+    with open(args.read, 'r') as f:
+      for msg in f:
+        handle_line(msg, frag_buffer)
+  finally:
+    if(sink != None):
+      decoder.flush()
+      sink.close()
+
+def main():
+
+  signal.signal(signal.SIGINT, sig_handler)
+  args = handle_args()
+  run(args)
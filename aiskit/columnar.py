@@ -0,0 +1,241 @@
+import os
+from array import array
+
+from .sixbit import ascii_to_sixbit
+
+# Columnar layouts: (column, start bit, length, kind[, scale]). Kind "u" is unsigned, "i" two's
+# complement signed, "s" six-bit text and "d" the binary data from start to the end of the message.
+# A scale turns the integer into a float column (value / scale).
+COMMON_COLUMNS = [("message_type", 0, 6, "u"), ("repeat", 6, 2, "u"), ("mmsi", 8, 30, "u")]
+
+POSITION_COLUMNS = [
+  ("nav_status", 38, 4, "u"), ("rot", 42, 8, "i"), ("sog", 50, 10, "u", 10.0), ("accuracy", 60, 1, "u"),
+  ("longitude", 61, 28, "i", 600000.0), ("latitude", 89, 27, "i", 600000.0), ("cog", 116, 12, "u", 10.0),
+  ("heading", 128, 9, "u"), ("second", 137, 6, "u"), ("maneuver", 143, 2, "u"), ("raim", 148, 1, "u"),
+  ("radio", 149, 19, "u")]
+
+UTC_COLUMNS = [
+  ("year", 38, 14, "u"), ("month", 52, 4, "u"), ("day", 56, 5, "u"), ("hour", 61, 5, "u"), ("minute", 66, 6, "u"),
+  ("second", 72, 6, "u"), ("accuracy", 78, 1, "u"), ("longitude", 79, 28, "i", 600000.0),
+  ("latitude", 107, 27, "i", 600000.0), ("epfd", 134, 4, "u"), ("raim", 148, 1, "u"), ("radio", 149, 19, "u")]
+
+COLUMNAR_LAYOUTS = {
+  "1": POSITION_COLUMNS,
+  "2": POSITION_COLUMNS,
+  "3": POSITION_COLUMNS,
+  "4": UTC_COLUMNS,
+  "5": [
+    ("ais_version", 38, 2, "u"), ("imo", 40, 30, "u"), ("call_sign", 70, 42, "s"), ("name", 112, 120, "s"),
+    ("ship_type", 232, 8, "u"), ("to_bow", 240, 9, "u"), ("to_stern", 249, 9, "u"), ("to_port", 258, 6, "u"),
+    ("to_starboard", 264, 6, "u"), ("epfd", 270, 4, "u"), ("eta_month", 274, 4, "u"), ("eta_day", 278, 5, "u"),
+    ("eta_hour", 283, 5, "u"), ("eta_minute", 288, 6, "u"), ("draught", 294, 8, "u", 10.0),
+    ("destination", 302, 120, "s"), ("dte", 422, 1, "u")],
+  "6": [
+    ("seqno", 38, 2, "u"), ("dest_mmsi", 40, 30, "u"), ("retransmit", 70, 1, "u"), ("dac", 72, 10, "u"),
+    ("fid", 82, 6, "u"), ("data", 88, 0, "d")],
+  "8": [("dac", 40, 10, "u"), ("fid", 50, 6, "u"), ("data", 56, 0, "d")],
+  "9": [
+    ("altitude", 38, 12, "u"), ("sog", 50, 10, "u"), ("accuracy", 60, 1, "u"), ("longitude", 61, 28, "i", 600000.0),
+    ("latitude", 89, 27, "i", 600000.0), ("cog", 116, 12, "u", 10.0), ("second", 128, 6, "u"), ("dte", 142, 1, "u"),
+    ("assigned", 146, 1, "u"), ("raim", 147, 1, "u"), ("radio", 148, 20, "u")],
+  "10": [("dest_mmsi", 40, 30, "u")],
+  "11": UTC_COLUMNS,
+  "16": [
+    ("mmsi_1", 40, 30, "u"), ("offset_1", 70, 12, "u"), ("increment_1", 82, 10, "u"),
+    ("mmsi_2", 92, 30, "u"), ("offset_2", 122, 12, "u"), ("increment_2", 134, 10, "u")],
+  "17": [("longitude", 40, 18, "i", 600.0), ("latitude", 58, 17, "i", 600.0), ("data", 80, 0, "d")],
+  "18": [
+    ("sog", 46, 10, "u", 10.0), ("accuracy", 56, 1, "u"), ("longitude", 57, 28, "i", 600000.0),
+    ("latitude", 85, 27, "i", 600000.0), ("cog", 112, 12, "u", 10.0), ("heading", 124, 9, "u"),
+    ("second", 133, 6, "u"), ("cs", 141, 1, "u"), ("display", 142, 1, "u"), ("dsc", 143, 1, "u"),
+    ("band", 144, 1, "u"), ("msg22", 145, 1, "u"), ("assigned", 146, 1, "u"), ("raim", 147, 1, "u"),
+    ("radio", 148, 20, "u")],
+  "19": [
+    ("sog", 46, 10, "u", 10.0), ("accuracy", 56, 1, "u"), ("longitude", 57, 28, "i", 600000.0),
+    ("latitude", 85, 27, "i", 600000.0), ("cog", 112, 12, "u", 10.0), ("heading", 124, 9, "u"),
+    ("second", 133, 6, "u"), ("name", 143, 120, "s"), ("ship_type", 263, 8, "u"), ("to_bow", 271, 9, "u"),
+    ("to_stern", 280, 9, "u"), ("to_port", 289, 6, "u"), ("to_starboard", 295, 6, "u"), ("epfd", 301, 4, "u"),
+    ("raim", 305, 1, "u"), ("dte", 306, 1, "u"), ("assigned", 307, 1, "u")],
+  "20": [
+    ("offset_1", 40, 12, "u"), ("number_1", 52, 4, "u"), ("timeout_1", 56, 3, "u"), ("increment_1", 59, 11, "u"),
+    ("offset_2", 70, 12, "u"), ("number_2", 82, 4, "u"), ("timeout_2", 86, 3, "u"), ("increment_2", 89, 11, "u"),
+    ("offset_3", 100, 12, "u"), ("number_3", 112, 4, "u"), ("timeout_3", 116, 3, "u"), ("increment_3", 119, 11, "u"),
+    ("offset_4", 130, 12, "u"), ("number_4", 142, 4, "u"), ("timeout_4", 146, 3, "u"), ("increment_4", 149, 11, "u")],
+  "21": [
+    ("aid_type", 38, 5, "u"), ("name", 43, 120, "s"), ("accuracy", 163, 1, "u"), ("longitude", 164, 28, "i", 600000.0),
+    ("latitude", 192, 27, "i", 600000.0), ("to_bow", 219, 9, "u"), ("to_stern", 228, 9, "u"), ("to_port", 237, 6, "u"),
+    ("to_starboard", 243, 6, "u"), ("epfd", 249, 4, "u"), ("second", 253, 6, "u"), ("off_position", 259, 1, "u"),
+    ("raim", 268, 1, "u"), ("virtual_aid", 269, 1, "u"), ("assigned", 270, 1, "u")],
+  "22": [
+    ("channel_a", 40, 12, "u"), ("channel_b", 52, 12, "u"), ("txrx", 64, 4, "u"), ("power", 68, 1, "u"),
+    ("ne_longitude", 69, 18, "i", 600.0), ("ne_latitude", 87, 17, "i", 600.0),
+    ("sw_longitude", 104, 18, "i", 600.0), ("sw_latitude", 122, 17, "i", 600.0), ("addressed", 139, 1, "u"),
+    ("band_a", 140, 1, "u"), ("band_b", 141, 1, "u"), ("zone_size", 142, 3, "u")],
+  "24A": [("part_number", 38, 2, "u"), ("name", 40, 120, "s")],
+  # Auxiliary craft send a mothership MMSI in the dimension bits, both readings are kept
+  "24B": [
+    ("part_number", 38, 2, "u"), ("ship_type", 40, 8, "u"), ("vendor_id", 48, 18, "s"), ("unit_model_code", 66, 4, "u"),
+    ("serial_number", 70, 20, "u"), ("call_sign", 90, 42, "s"), ("to_bow", 132, 9, "u"), ("to_stern", 141, 9, "u"),
+    ("to_port", 150, 6, "u"), ("to_starboard", 156, 6, "u"), ("mothership_mmsi", 132, 30, "u")],
+  "25": [("addressed", 38, 1, "u"), ("structured", 39, 1, "u"), ("data", 40, 0, "d")],
+}
+
+DEFAULT_LAYOUT = [("data", 38, 0, "d")]
+
+# Maps each armored payload character to its six bits written as two octal digits, so a whole
+# payload converts to one integer with a single str.translate() and int(..., 8).
+ARMOR_TO_OCTAL = {value + (48 if value < 40 else 56): format(value, '02o') for value in range(64)}
+
+AIS_TEXT = "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_ !\"#$%&'()*+,-./0123456789:;<=>?"
+
+def layout_key(payload):
+  # Table a payload belongs in: its message type, with type 24 split into Part A and Part B
+  message_type = ascii_to_sixbit(payload[0])
+  if message_type == 24:
+    return "24B" if ascii_to_sixbit(payload[6]) & 0b1100 else "24A"  # Part number is bits 38-39
+  return str(message_type)
+
+def armored_to_int(payload, fill_bits=0):
+  # Returns the payload as (integer value, number of bits) with the sentence's fill bits removed
+  octal = payload.translate(ARMOR_TO_OCTAL)
+  if len(octal) != 2 * len(payload):
+    raise ValueError("Invalid AIS character")
+  nbits = 6 * len(payload)
+  fill_bits = min(fill_bits, nbits)
+  return int(octal, 8) >> fill_bits, nbits - fill_bits
+
+def decode_batch(key, messages):
+  # Decode a batch of (value, nbits) messages sharing a layout into columns: array('q') for
+  # integers, array('d') for scaled values and (offsets, data) pairs in Arrow's layout for text
+  # and binary data. Returns (columns, nulls) where nulls maps a column to the rows whose message
+  # ended before the field did.
+  layout = COMMON_COLUMNS + COLUMNAR_LAYOUTS.get(key, DEFAULT_LAYOUT)
+  fixed_bits = max(field[1] + field[2] for field in layout)
+  columns = {}
+  nulls = {}
+  extractors = []
+  for field in layout:
+    name, start, length, kind = field[:4]
+    scale = field[4] if len(field) > 4 else None
+    if kind in "sd":
+      column = columns[name] = (array('i', [0]), bytearray())
+    else:
+      column = columns[name] = array('q' if scale == None else 'd')
+    if kind == "d":
+      columns[name + "_bits"] = array('q')
+    extractors.append((name, fixed_bits - start - length, start, length, kind, scale, column))
+
+  for row, (value, nbits) in enumerate(messages):
+    # Zero-fill short messages so every fixed field can be read at the same shift
+    padded = value << (fixed_bits - nbits) if nbits < fixed_bits else value >> (nbits - fixed_bits)
+    for name, shift, start, length, kind, scale, column in extractors:
+      if start + length > nbits:
+        # Field missing from a short message (e.g. a type 16 with one destination)
+        nulls.setdefault(name, []).append(row)
+        if kind in "sd":
+          column[0].append(len(column[1]))
+        else:
+          column.append(0)
+        if kind == "d":
+          nulls.setdefault(name + "_bits", []).append(row)
+          columns[name + "_bits"].append(0)
+        continue
+      if kind == "d":
+        data_bits = max(nbits - start, 0)
+        data = value & ((1 << data_bits) - 1)
+        offsets, buffer = column
+        buffer += (data << (-data_bits % 8)).to_bytes((data_bits + 7) // 8, 'big')
+        offsets.append(len(buffer))
+        columns[name + "_bits"].append(data_bits)
+        continue
+      field = (padded >> shift) & ((1 << length) - 1)
+      if kind == "s":
+        text = "".join(AIS_TEXT[(field >> i) & 63] for i in range(length - 6, -1, -6))
+        offsets, buffer = column
+        buffer += text.rstrip("@").strip().encode('ascii')
+        offsets.append(len(buffer))
+        continue
+      if kind == "i" and field >> (length - 1):
+        field -= 1 << length
+      column.append(field if scale == None else field / scale)
+  return columns, nulls
+
+def validity_bitmap(length, null_rows):
+  # Arrow validity bitmap (least significant bit first) with the given rows marked null
+  bitmap = bytearray(b"\xff" * ((length + 7) // 8))
+  for row in null_rows:
+    bitmap[row >> 3] &= ~(1 << (row & 7)) & 0xff
+  return bitmap
+
+def columns_to_arrow(columns, nulls=None):
+  # Wrap decoded columns as a pyarrow RecordBatch without copying the buffers
+  import pyarrow as pa
+  nulls = nulls or {}
+  arrays = []
+  for name, column in columns.items():
+    if isinstance(column, array):
+      length = len(column)
+      arrow_type = pa.int64() if column.typecode == 'q' else pa.float64()
+      buffers = [pa.py_buffer(column)]
+    else:
+      offsets, buffer = column
+      length = len(offsets) - 1
+      arrow_type = pa.binary() if name + "_bits" in columns else pa.string()
+      buffers = [pa.py_buffer(offsets), pa.py_buffer(buffer)]
+    null_rows = nulls.get(name, ())
+    validity = pa.py_buffer(validity_bitmap(length, null_rows)) if null_rows else None
+    arrays.append(pa.Array.from_buffers(arrow_type, length, [validity] + buffers, null_count=len(null_rows)))
+  return pa.RecordBatch.from_arrays(arrays, names=list(columns))
+
+class ColumnarDecoder:
+  # Groups payloads by layout and decodes them batch_size at a time. Each finished batch is
+  # passed to sink(key, record_batch), or kept in memory for tables() when there is no sink.
+  def __init__(self, batch_size=65536, sink=None):
+    self.batch_size = batch_size
+    self.sink = sink
+    self.pending = {}
+    self.batches = {}
+
+  def add(self, payload, fill_bits=0):
+    key = layout_key(payload)
+    pending = self.pending.setdefault(key, [])
+    pending.append(armored_to_int(payload, fill_bits))
+    if len(pending) >= self.batch_size:
+      self.flush(key)
+
+  def flush(self, key=None):
+    for key in ([key] if key != None else list(self.pending)):
+      messages = self.pending.pop(key, None)
+      if not messages:
+        continue
+      batch = columns_to_arrow(*decode_batch(key, messages))
+      if self.sink != None:
+        self.sink(key, batch)
+      else:
+        self.batches.setdefault(key, []).append(batch)
+
+  def tables(self):
+    # Returns a pyarrow Table per layout key ("1", "5", "24A", ...) for everything added so far
+    import pyarrow as pa
+    self.flush()
+    return {key: pa.Table.from_batches(batches) for key, batches in self.batches.items()}
+
+class ArrowFileSink:
+  # Streams record batches into one Arrow IPC file per layout key in directory
+  def __init__(self, directory):
+    os.makedirs(directory, exist_ok=True)
+    self.directory = directory
+    self.writers = {}
+
+  def __call__(self, key, batch):
+    import pyarrow as pa
+    writer = self.writers.get(key)
+    if writer == None:
+      path = os.path.join(self.directory, f"type_{key.lower()}.arrow")
+      writer = self.writers[key] = pa.ipc.new_file(path, batch.schema)
+    writer.write_batch(batch)
+
+  def close(self):
+    for writer in self.writers.values():
+      writer.close()
+    self.writers = {}
@@ -0,0 +1,126 @@
+import os, json, select, signal, time
+
+def read_checkpoint(path):
+  # Returns (inode, offset, frag_buffer) saved by write_checkpoint, or None if there is no usable checkpoint
+  try:
+    with open(path, 'r') as f:
+      data = json.load(f)
+    return data["inode"], data["offset"], {seq: payload for seq, payload in data["fragments"]}
+  except (OSError, ValueError, KeyError, TypeError):
+    return None
+
+def write_checkpoint(path, inode, offset, frag_buffer):
+  # Write to a temporary file and rename over the old checkpoint so a crash never leaves it half written
+  tmp_path = path + ".tmp"
+  with open(tmp_path, 'w') as f:
+    json.dump({"inode": inode, "offset": offset, "fragments": list(frag_buffer.items())}, f)
+  os.replace(tmp_path, path)
+
+def inotify_watch(path):
+  # Returns an inotify fd watching the directory holding path (catches writes, rotation and
+  # re-creation), or None where inotify is not available and follow() should poll instead
+  try:
+    import ctypes, ctypes.util
+    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+  except (OSError, AttributeError, TypeError):
+    return None
+  if fd < 0:
+    return None
+  # IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+  if libc.inotify_add_watch(fd, os.fsencode(os.path.dirname(os.path.abspath(path))), 0x002 | 0x040 | 0x080 | 0x100 | 0x200) < 0:
+    os.close(fd)
+    return None
+  return fd
+
+def wait_for_change(watch_fd, timeout):
+  # Sleep until inotify reports activity or timeout seconds pass. The timeout bounds how long
+  # a missed event (or a platform without inotify) can delay noticing new data.
+  if watch_fd is None:
+    time.sleep(timeout)
+    return
+  if select.select([watch_fd], [], [], timeout)[0]:
+    try:
+      while os.read(watch_fd, 4096):
+        pass
+    except BlockingIOError:
+      pass
+
+def follow(args, handle_line):
+  # Tail args.read, passing each complete new line to handle_line(line, frag_buffer). Survives
+  # rotation (file replaced) and truncation, and checkpoints the byte offset and pending
+  # fragments so a restart resumes where it left off.
+  path = args.read
+  inode, offset, frag_buffer = None, 0, {}
+  if args.checkpoint:
+    saved = read_checkpoint(args.checkpoint)
+    if saved != None:
+      inode, offset, frag_buffer = saved
+
+  # Ctrl-C and SIGTERM (sent by service managers on stop) are acted on between lines, so the final
+  # checkpoint is always written and never follows a half handled line
+  stopping = []
+  handlers = {sig: signal.signal(sig, lambda sig, frame: stopping.append(sig)) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+  watch_fd = inotify_watch(path)
+  f = None
+  rotated = False
+  dirty = False
+  last_checkpoint = time.monotonic()
+  try:
+    while not stopping:
+      if f == None:
+        try:
+          f = open(path, 'rb')
+        except FileNotFoundError:
+          wait_for_change(watch_fd, args.poll_interval)
+          continue
+        st = os.fstat(f.fileno())
+        if st.st_ino != inode or st.st_size < offset:
+          offset = 0  # A different or truncated file from the one checkpointed, start from the top
+        inode = st.st_ino
+        f.seek(offset)
+
+      line = f.readline()
+      if line.endswith(b"\n"):
+        handle_line(line.decode('ascii', errors='replace'), frag_buffer)
+        offset += len(line)  # Only count the line once handled, so an exit part way through replays it
+        dirty = True
+        if args.checkpoint and time.monotonic() - last_checkpoint >= args.checkpoint_interval:
+          write_checkpoint(args.checkpoint, inode, offset, frag_buffer)
+          last_checkpoint = time.monotonic()
+          dirty = False
+        continue
+
+      # At EOF, possibly part way through a line still being written. Leave it for the next read.
+      f.seek(offset)
+      if rotated:
+        # The old file has been drained, move on to its replacement
+        f.close()
+        f, inode, offset, rotated = None, None, 0, False
+        continue
+      if args.checkpoint and dirty and time.monotonic() - last_checkpoint >= args.checkpoint_interval:
+        write_checkpoint(args.checkpoint, inode, offset, frag_buffer)
+        last_checkpoint = time.monotonic()
+        dirty = False
+      try:
+        st = os.stat(path)
+      except FileNotFoundError:
+        st = None
+      if st != None and st.st_ino != inode:
+        rotated = True  # Read anything written to the old file before the rename, then switch
+        continue
+      if st != None and st.st_size < offset:
+        offset = 0  # Truncated in place (copytruncate)
+        f.seek(0)
+        continue
+      wait_for_change(watch_fd, args.poll_interval)
+  finally:
+    for sig, handler in handlers.items():
+      signal.signal(sig, handler)
+    if f != None:
+      f.close()
+    if watch_fd != None:
+      os.close(watch_fd)
+    if args.checkpoint and inode != None:
+      write_checkpoint(args.checkpoint, inode, offset, frag_buffer)
@@ -0,0 +1,51 @@
+def split_tag_block(line):
+  # Separate an optional NMEA 4.0 tag block (\s:rx1,c:1700000000*hh\) from the sentence
+  tags = {}
+  if line.startswith("\\"):
+    end = line.find("\\", 1)
+    if end > 0:
+      for field in line[1:end].split("*")[0].split(","):
+        key, _, value = field.partition(":")
+        tags[key] = value
+      line = line[end + 1:]
+  return tags, line
+
+def tag_timestamp(tags):
+  # Receive time from the tag block "c" field (UNIX seconds, or milliseconds on some receivers)
+  try:
+    stamp = float(tags["c"])
+  except (KeyError, ValueError):
+    return None
+  return stamp / 1000.0 if stamp > 1e11 else stamp
+
+def fill_bits(nmea_msg):
+  # Padding bits at the end of the payload, from the field before the checksum
+  try:
+    return int(nmea_msg[6].split("*")[0])
+  except (IndexError, ValueError):
+    return 0
+
+def reassemble(frag_buffer, msg):
+  # Returns (tags, nmea_msg, ais_payload) for a complete message, or None while waiting on fragments
+  tags, msg = split_tag_block(msg)
+  if(not msg.strip()):
+    return None
+  nmea_msg = msg.split(",")
+  frags = int(nmea_msg[1])
+  frag_num = int(nmea_msg[2])
+  frag_seq = None
+  if(len(nmea_msg[3]) > 0):
+    frag_seq = int(nmea_msg[3])
+  ais_payload = nmea_msg[5]
+  if(frags > 1):
+    if(frag_seq in frag_buffer and frag_num > 1):
+      frag_buffer[frag_seq] += ais_payload
+      if(frags != frag_num):
+         return None
+      else:
+        ais_payload = frag_buffer[frag_seq]
+        frag_buffer.pop(frag_seq)
+    else:
+      frag_buffer[frag_seq] = ais_payload
+      return None
+  return tags, nmea_msg, ais_payload
@@ -0,0 +1,33 @@
+def decode_armored_ascii(ais_message):
+  bitstream = ""
+  for char in ais_message:
+    sixbit_value = ascii_to_sixbit(char)
+    bitstream += format(sixbit_value, '06b')
+  return bitstream
+
+def ascii_to_sixbit(char):
+  value = ord(char)
+  if 48 <= value <= 87:  # '0' (48) -> 0 to 'W' (87) -> 39
+    return value - 48
+  elif 96 <= value <= 119:  # '`' (96) -> 40 to 'w' (119) -> 63
+    return value - 56
+  else:
+    raise ValueError("Invalid AIS character")
+
+def sixbit_to_ascii(bitstream, start, length):
+  AIS_CHARACTERS = "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_ !\"#$%&'()*+,-./0123456789:;<=>?"
+  text = ""
+  for i in range(start, start + length, 6):
+    char_val = int(bitstream[i:i + 6], 2)
+    if char_val < len(AIS_CHARACTERS):
+     text += AIS_CHARACTERS[char_val]
+    else:
+     text += " "
+  return text.strip().rstrip('@')
+
+def parse_binary_data_payload(payload):
+  text = ""
+  for i in range(0, len(payload), 6):
+    char_code = int(payload[i:i+6], 2) + 48
+    text += chr(char_code) if char_code < 128 else '?'
+  return text
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+class StaticReportCache:
+  # Joins type 24 Part A and Part B reports into one static record per MMSI. Holds at most
+  # max_vessels half records, and a part older than max_age seconds is not joined. Parts with a
+  # timestamp of None never expire.
+  def __init__(self, max_vessels=100000, max_age=600.0):
+    self.parts = OrderedDict()
+    self.max_vessels = max_vessels
+    self.max_age = max_age
+
+  def expire(self, timestamp):
+    # Entries are kept in order of last update, so expired ones are at the front
+    while self.parts:
+      mmsi, entry = next(iter(self.parts.items()))
+      if timestamp is None or entry["time"] is None or timestamp - entry["time"] <= self.max_age:
+        break
+      self.parts.popitem(last=False)
+
+  def add(self, msg_dict, timestamp):
+    # Returns the combined record once both parts are held for the MMSI, otherwise None
+    self.expire(timestamp)
+    part_number = msg_dict["Part Number"]
+    if part_number not in (0, 1):
+      return None
+    mmsi = msg_dict["MMSI"]
+    entry = self.parts.pop(mmsi, {})
+    entry[part_number] = (msg_dict, timestamp)
+    other = entry.get(1 - part_number)
+    if other is not None and (timestamp is None or other[1] is None or timestamp - other[1] <= self.max_age):
+      part_a, part_b = entry[0][0], entry[1][0]
+      combined = dict(part_a)
+      combined.update(part_b)
+      del combined["Part Number"]
+      return combined
+    entry["time"] = timestamp
+    self.parts[mmsi] = entry
+    if len(self.parts) > self.max_vessels:
+      self.parts.popitem(last=False)
+    return None
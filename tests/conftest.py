@@ -0,0 +1,4 @@
+import os, sys
+
+# Make the aiskit package importable when the tests are run from any directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,59 @@
+import os, subprocess, sys
+
+from aiskit.anomaly import AnomalyDetector, mmsi_is_valid, imo_is_valid
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AISDUMP = os.path.join(ROOT, "aisdump.py")
+TRACK = os.path.join(ROOT, "tests", "data", "track.nmea")
+
+def position(mmsi, lat, lon):
+  return {"Message Type": 1, "MMSI": mmsi, "Latitude": lat, "Longitude": lon}
+
+def kinds(anomalies):
+  return [anomaly["Anomaly"] for anomaly in anomalies]
+
+def test_mmsi_is_valid():
+  assert mmsi_is_valid(235000001)       # Ship, UK MID
+  assert mmsi_is_valid(992351234)       # Aid to navigation
+  assert mmsi_is_valid(970123456)       # AIS-SART
+  assert not mmsi_is_valid(123456789)   # No MID 123
+  assert not mmsi_is_valid(0)
+  assert not mmsi_is_valid(1000000000)
+
+def test_imo_is_valid():
+  assert imo_is_valid(9876543)
+  assert not imo_is_valid(9876544)
+  assert not imo_is_valid(123)
+
+def test_position_jump_then_collision():
+  detector = AnomalyDetector()
+  assert detector.check(position(235000001, 51.0, -3.0), 0) == []
+  assert detector.check(position(235000001, 51.01, -3.0), 60) == []
+  assert kinds(detector.check(position(235000001, 55.0, -3.0), 120)) == ["Position Jump"]
+  # Back on the first track: two transmitters share the MMSI
+  assert kinds(detector.check(position(235000001, 51.02, -3.0), 180)) == ["MMSI Collision"]
+
+def test_normal_speed_is_not_flagged():
+  detector = AnomalyDetector()
+  for i in range(10):
+    assert detector.check(position(235000001, 51.0 + i * 0.025, -3.0), i * 360) == []  # 1.5 nm every 6 minutes
+
+def test_untimed_fixes_skip_speed_checks():
+  detector = AnomalyDetector()
+  assert detector.check(position(235000001, 51.0, -3.0), None) == []
+  assert detector.check(position(235000001, 55.0, -3.0), None) == []
+
+def test_identity_change_and_invalid_imo():
+  detector = AnomalyDetector()
+  static = {"Message Type": 5, "MMSI": 235000001, "IMO Number": 9876543, "Vessel Name": "HISPANIOLA"}
+  assert detector.check(static, None) == []
+  assert kinds(detector.check(dict(static, **{"Vessel Name": "OTHER"}), None)) == ["Identity Change"]
+  assert kinds(detector.check(dict(static, **{"IMO Number": 9876544, "Vessel Name": "OTHER"}), None)) == ["Invalid IMO", "Identity Change"]
+
+def test_cli_reports_anomalies_filtered_by_type():
+  result = subprocess.run([sys.executable, AISDUMP, "-r", TRACK, "-a"], capture_output=True, text=True, check=True)
+  assert [line for line in result.stdout.splitlines() if line.startswith("Anomaly:")] == [
+    "Anomaly: Position Jump", "Anomaly: MMSI Collision", "Anomaly: MMSI Collision", "Anomaly: Identity Change", "Anomaly: Invalid MMSI"]
+  result = subprocess.run([sys.executable, AISDUMP, "-r", TRACK, "-a", "-t", "5"], capture_output=True, text=True, check=True)
+  assert "Message Type: 1" not in result.stdout
+  assert "Anomaly: Identity Change" in result.stdout
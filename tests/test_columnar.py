@@ -0,0 +1,78 @@
+import os, subprocess, sys
+
+import pytest
+
+from aiskit.columnar import ColumnarDecoder, armored_to_int, decode_batch, layout_key
+from aiskit.nmea import reassemble, fill_bits
+from aiskit.parsers import parse_ais
+from aiskit.sixbit import decode_armored_ascii
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AISDUMP = os.path.join(ROOT, "aisdump.py")
+DATA = os.path.join(ROOT, "tests", "data")
+
+def read_payloads(name):
+  # Returns (payload, fill bits) for each complete message in a fixture
+  frag_buffer = {}
+  payloads = []
+  with open(os.path.join(DATA, name)) as f:
+    for line in f:
+      message = reassemble(frag_buffer, line)
+      if message != None:
+        payloads.append((message[2], fill_bits(message[1])))
+  return payloads
+
+def test_layout_key():
+  keys = [layout_key(payload) for payload, fill in read_payloads("type24.nmea")]
+  assert keys == ["24B", "24A", "24A", "24A", "24B"]
+  assert layout_key(read_payloads("track.nmea")[0][0]) == "1"
+
+def test_armored_to_int_strips_fill_bits():
+  assert armored_to_int("w") == (63, 6)
+  assert armored_to_int("w", 2) == (15, 4)
+  with pytest.raises(ValueError):
+    armored_to_int("w!")
+
+def test_columns_match_dict_parser():
+  payloads = [payload for payload, fill in read_payloads("track.nmea")]
+  positions = [payload for payload in payloads if layout_key(payload) == "1"]
+  columns, nulls = decode_batch("1", [armored_to_int(payload) for payload in positions])
+  assert nulls == {}
+  for row, payload in enumerate(positions):
+    msg_dict = parse_ais(decode_armored_ascii(payload))
+    assert columns["mmsi"][row] == msg_dict["MMSI"]
+    assert columns["latitude"][row] == msg_dict["Latitude"]
+    assert columns["longitude"][row] == msg_dict["Longitude"]
+
+def test_short_message_fields_are_null():
+  (payload_16, fill_16), (payload_8, fill_8) = read_payloads("short.nmea")
+  columns, nulls = decode_batch("16", [armored_to_int(payload_16, fill_16)])
+  assert columns["mmsi_1"][0] == 235000009
+  assert columns["offset_1"][0] == 100
+  assert nulls == {"mmsi_2": [0], "offset_2": [0], "increment_2": [0]}
+
+def test_arrow_tables():
+  pytest.importorskip("pyarrow")
+  decoder = ColumnarDecoder(batch_size=2)
+  for name in ("track.nmea", "type24.nmea", "short.nmea"):
+    for payload, fill in read_payloads(name):
+      decoder.add(payload, fill)
+  tables = decoder.tables()
+  assert sorted(tables) == ["1", "16", "24A", "24B", "5", "8"]
+  assert tables["1"].num_rows == 5
+  assert tables["5"].column("name").to_pylist() == ["HISPANIOLA", "OTHER", "HISPANIOLA"]
+  assert tables["24B"].column("call_sign").to_pylist() == ["MABC1", "TND"]
+  assert tables["16"].to_pylist()[0]["mmsi_2"] == None
+  assert tables["8"].to_pylist()[0]["data"] == b"\xb3"
+  assert tables["8"].to_pylist()[0]["data_bits"] == 8
+
+def test_cli_writes_arrow_files(tmp_path):
+  pa = pytest.importorskip("pyarrow")
+  subprocess.run([sys.executable, AISDUMP, "-r", os.path.join(DATA, "track.nmea"), "-c", str(tmp_path)], check=True)
+  assert sorted(os.listdir(tmp_path)) == ["type_1.arrow", "type_5.arrow"]
+  assert pa.ipc.open_file(str(tmp_path / "type_1.arrow")).read_all().num_rows == 5
+
+def test_cli_rejects_columnar_with_follow(tmp_path):
+  result = subprocess.run([sys.executable, AISDUMP, "-r", os.path.join(DATA, "track.nmea"), "-c", str(tmp_path), "-f"], capture_output=True, text=True)
+  assert result.returncode == 2
+  assert "--columnar cannot be combined" in result.stderr
@@ -0,0 +1,99 @@
+import json, os, shutil, signal, subprocess, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AISDUMP = os.path.join(ROOT, "aisdump.py")
+DATA = os.path.join(ROOT, "tests", "data")
+
+def start_follow(path, checkpoint):
+  return subprocess.Popen([sys.executable, AISDUMP, "-r", path, "-f", "--checkpoint", checkpoint, "--checkpoint-interval", "0", "--poll-interval", "0.1", "-i"],
+    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+def wait_for(condition, timeout=10):
+  deadline = time.monotonic() + timeout
+  while not condition():
+    assert time.monotonic() < deadline, "timed out"
+    time.sleep(0.05)
+
+def read_checkpoint(path):
+  try:
+    with open(path) as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return None
+
+def checkpoint_at(path, offset):
+  return lambda: (read_checkpoint(path) or {}).get("offset") == offset
+
+def stop(proc):
+  proc.send_signal(signal.SIGTERM)
+  stdout, stderr = proc.communicate(timeout=10)
+  assert proc.returncode == 0, stderr
+  return stdout
+
+def test_malformed_line_is_skipped_and_checkpointed(tmp_path):
+  log = str(tmp_path / "ais.log")
+  checkpoint = str(tmp_path / "ais.json")
+  shutil.copy(os.path.join(DATA, "malformed.nmea"), log)
+
+  proc = start_follow(log, checkpoint)
+  wait_for(checkpoint_at(checkpoint, os.path.getsize(log)))
+  stdout = stop(proc)
+  assert "Encountered error parsing message garbage line" in stdout
+  assert "MMSI: 123456789" in stdout
+
+  # A restart resumes after the bad line rather than replaying it
+  proc = start_follow(log, checkpoint)
+  time.sleep(0.5)
+  assert stop(proc) == ""
+  assert read_checkpoint(checkpoint)["offset"] == os.path.getsize(log)
+
+def lines(name):
+  with open(os.path.join(DATA, name)) as f:
+    return f.readlines()
+
+def append(path, text):
+  with open(path, "a") as f:
+    f.write(text)
+
+def test_rotation_drains_old_file_then_reads_new_one(tmp_path):
+  log = str(tmp_path / "ais.log")
+  checkpoint = str(tmp_path / "ais.json")
+  append(log, "".join(lines("type5.nmea")))
+
+  proc = start_follow(log, checkpoint)
+  wait_for(checkpoint_at(checkpoint, os.path.getsize(log)))
+  append(log, lines("track.nmea")[0])  # Written just before rotation, must still be read
+  os.rename(log, log + ".1")
+  append(log, "".join(lines("type24.nmea")))
+  inode = os.stat(log).st_ino
+  wait_for(lambda: (read_checkpoint(checkpoint) or {}).get("inode") == inode and checkpoint_at(checkpoint, os.path.getsize(log))())
+  mmsis = [line for line in stop(proc).splitlines() if line.startswith("MMSI:")]
+  assert mmsis == ["MMSI: 123456789", "MMSI: 235000001", "MMSI: 235000002", "MMSI: 235000003", "MMSI: 235000002", "MMSI: 982350001", "MMSI: 982350001"]
+
+def test_truncation_restarts_from_top(tmp_path):
+  log = str(tmp_path / "ais.log")
+  checkpoint = str(tmp_path / "ais.json")
+  append(log, "".join(lines("type5.nmea")))
+
+  proc = start_follow(log, checkpoint)
+  wait_for(checkpoint_at(checkpoint, os.path.getsize(log)))
+  with open(log, "w") as f:
+    f.write(lines("type24.nmea")[1])
+  wait_for(checkpoint_at(checkpoint, os.path.getsize(log)))
+  assert "MMSI: 235000003" in stop(proc)
+
+def test_resume_keeps_pending_fragment(tmp_path):
+  log = str(tmp_path / "ais.log")
+  checkpoint = str(tmp_path / "ais.json")
+  first, second = lines("type5.nmea")
+  append(log, first)
+
+  proc = start_follow(log, checkpoint)
+  wait_for(checkpoint_at(checkpoint, len(first)))
+  assert stop(proc) == ""
+  assert read_checkpoint(checkpoint)["fragments"] == [[9, first.split(",")[5]]]
+
+  append(log, second)
+  proc = start_follow(log, checkpoint)
+  wait_for(checkpoint_at(checkpoint, os.path.getsize(log)))
+  assert stop(proc).splitlines()[:3] == ["MMSI: 123456789", "Call Sign: KRMT", "Vessel Name: HISPANIOLA"]
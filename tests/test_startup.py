@@ -0,0 +1,33 @@
+import os, statistics, subprocess, sys, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AISDUMP = os.path.join(ROOT, "aisdump.py")
+FIXTURE = os.path.join(ROOT, "tests", "data", "type5.nmea")
+
+# Modules a plain dump must not load: optional stages, their dependencies and pyarrow
+LAZY_MODULES = ["aiskit.anomaly", "aiskit.columnar", "aiskit.follow", "aiskit.static", "pyarrow", "json", "select", "ctypes"]
+
+# Median wall time for a small dump. Measured at ~41 ms, the rest is slack for slower machines.
+STARTUP_BUDGET = 0.100
+RUNS = 9
+
+def run_aisdump(*python_args):
+  return subprocess.run([sys.executable, *python_args, AISDUMP, "-r", FIXTURE, "-i"], capture_output=True, text=True, check=True)
+
+def test_dump_only_imports_needed_modules():
+  result = run_aisdump("-X", "importtime")
+  # -X importtime writes "import time: self | cumulative | module" for each import to stderr
+  imported = {line.rsplit("|", 1)[1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+  assert "MMSI: 123456789" in result.stdout
+  assert "aiskit.parsers" in imported
+  loaded = [name for name in imported if name in LAZY_MODULES or name.startswith(tuple(m + "." for m in LAZY_MODULES))]
+  assert loaded == []
+
+def test_dump_startup_within_budget():
+  run_aisdump()  # Warm up the bytecode cache
+  times = []
+  for _ in range(RUNS):
+    start = time.perf_counter()
+    run_aisdump()
+    times.append(time.perf_counter() - start)
+  assert statistics.median(times) < STARTUP_BUDGET
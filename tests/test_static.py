@@ -0,0 +1,70 @@
+import os, subprocess, sys
+
+from aiskit.nmea import reassemble
+from aiskit.parsers import parse_ais
+from aiskit.sixbit import decode_armored_ascii
+from aiskit.static import StaticReportCache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AISDUMP = os.path.join(ROOT, "aisdump.py")
+TYPE24 = os.path.join(ROOT, "tests", "data", "type24.nmea")
+
+def read_messages(path):
+  frag_buffer = {}
+  messages = []
+  with open(path) as f:
+    for line in f:
+      message = reassemble(frag_buffer, line)
+      if message != None:
+        messages.append(parse_ais(decode_armored_ascii(message[2])))
+  return messages
+
+def test_part_a_and_part_b_fields():
+  part_b, lonely_a, part_a, aux_a, aux_b = read_messages(TYPE24)
+  assert part_a == {"Message Type": 24, "Repeat Indicator": 0, "MMSI": 235000002, "Part Number": 0, "Name": "SEA BREEZE"}
+  assert part_b["Part Number"] == 1
+  assert part_b["Ship Type"] == 37
+  assert part_b["Vendor ID"] == "SRT"
+  assert part_b["Unit Model Code"] == 2
+  assert part_b["Serial Number"] == 12345
+  assert part_b["Call Sign"] == "MABC1"
+  assert part_b["Dimensions (Bow, Stern, Port, Starboard)"] == (10, 5, 2, 3)
+  assert "Mothership MMSI" not in part_b
+
+def test_auxiliary_craft_reports_mothership():
+  aux_b = read_messages(TYPE24)[-1]
+  assert aux_b["MMSI"] == 982350001
+  assert aux_b["Mothership MMSI"] == 235000002
+  assert "Dimensions (Bow, Stern, Port, Starboard)" not in aux_b
+
+def test_cache_merges_parts_in_either_order():
+  part_b, lonely_a, part_a, aux_a, aux_b = read_messages(TYPE24)
+  cache = StaticReportCache()
+  assert cache.add(part_b, 0) == None
+  assert cache.add(lonely_a, 1) == None
+  combined = cache.add(part_a, 2)
+  assert combined["Name"] == "SEA BREEZE"
+  assert combined["Call Sign"] == "MABC1"
+  assert "Part Number" not in combined
+  assert cache.add(aux_a, 3) == None
+  assert cache.add(aux_b, 4)["Mothership MMSI"] == 235000002
+  assert list(cache.parts) == [235000003]  # Only the unmatched half is still held
+
+def test_cache_expires_old_parts():
+  part_b, lonely_a, part_a, aux_a, aux_b = read_messages(TYPE24)
+  cache = StaticReportCache(max_age=600)
+  assert cache.add(part_b, 0) == None
+  assert cache.add(part_a, 601) == None
+
+def test_cache_is_bounded():
+  part_b, lonely_a, part_a, aux_a, aux_b = read_messages(TYPE24)
+  cache = StaticReportCache(max_vessels=1)
+  cache.add(part_b, None)
+  cache.add(lonely_a, None)
+  assert list(cache.parts) == [235000003]
+
+def test_cli_merge_static():
+  result = subprocess.run([sys.executable, AISDUMP, "-r", TYPE24, "-m", "-i"], capture_output=True, text=True, check=True)
+  assert result.stdout.split("\n\n")[:2] == [
+    "MMSI: 235000002\nName: SEA BREEZE\nCall Sign: MABC1",
+    "MMSI: 982350001\nName: TENDER\nCall Sign: TND"]